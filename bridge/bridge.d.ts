@@ -136,7 +136,7 @@ export interface UniversalBridge {
     DemoPoint_create(arg0: number, arg1: number): string;
     DemoVec3_create(arg0: number, arg1: number, arg2: number): string;
     add(arg0: number, arg1: number): number;
-    processImage(arg0: number, arg1: number): void;
+    processImage(arg0: Uint8Array, arg1: number): void;
     get_counter(): number;
     set_counter(arg0: number): void;
     get_name(): number;
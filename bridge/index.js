@@ -140,18 +140,9 @@ function bindBufferFunction(lib, name, info) {
         return TYPE_MAP[t] || t;
     });
 
-    const fn = lib.func(name, returnType, paramTypes);
-
-    // Return wrapper that handles Uint8Array conversion
-    return (...args) => {
-        const convertedArgs = args.map((arg, i) => {
-            if (arg instanceof Uint8Array) {
-                return arg; // Koffi handles Uint8Array directly
-            }
-            return arg;
-        });
-        return fn(...convertedArgs);
-    };
+    // Koffi passes Uint8Array straight through as uint8*, so the bound
+    // function is returned as-is: no per-call copy of the argument list.
+    return lib.func(name, returnType, paramTypes);
 }
 
 // =============================================================================
@@ -249,20 +240,33 @@ function runInWorker(dllPath, funcName, returnType, paramTypes, args) {
 // MAGIC STORE
 // =============================================================================
 
+// Same { returnType, params } shape as registry.json entries
+const STORE_SIGNATURES = {
+    _store_get: { returnType: 'str', params: ['str'] },
+    _store_set: { returnType: 'void', params: ['str', 'str'] },
+    _store_get_int: { returnType: 'int', params: ['str'] },
+    _store_set_int: { returnType: 'void', params: ['str', 'int'] },
+    _store_dump: { returnType: 'str', params: [] },
+};
+
+function bindSignatures(lib, signatures) {
+    const bound = {};
+    for (const [name, info] of Object.entries(signatures)) {
+        bound[name] = lib.func(name, info.returnType, info.params);
+    }
+    return bound;
+}
+
 function createStoreProxy(lib) {
     try {
-        const _store_get = lib.func('_store_get', 'str', ['str']);
-        const _store_set = lib.func('_store_set', 'void', ['str', 'str']);
-        const _store_get_int = lib.func('_store_get_int', 'int', ['str']);
-        const _store_set_int = lib.func('_store_set_int', 'void', ['str', 'int']);
-        const _store_dump = lib.func('_store_dump', 'str', []);
+        const store = bindSignatures(lib, STORE_SIGNATURES);
 
         return {
-            get: (key) => _store_get(key),
-            set: (key, value) => _store_set(key, String(value)),
-            getInt: (key) => _store_get_int(key),
-            setInt: (key, value) => _store_set_int(key, value),
-            dump: () => JSON.parse(_store_dump() || '{}'),
+            get: (key) => store._store_get(key),
+            set: (key, value) => store._store_set(key, String(value)),
+            getInt: (key) => store._store_get_int(key),
+            setInt: (key, value) => store._store_set_int(key, value),
+            dump: () => JSON.parse(store._store_dump() || '{}'),
         };
     } catch (e) {
         return { get: () => null, set: () => { }, dump: () => ({}) };
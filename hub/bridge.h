@@ -29,6 +29,33 @@
 #define BRIDGE_EXPORT extern "C" __attribute__((visibility("default")))
 #endif
 
+// =============================================================================
+// BRANCH HINTS - Hot/cold code placement
+// =============================================================================
+// Usage: BRIDGE_HOT static int step(int x) { ... }
+//        if (queue.empty()) BRIDGE_LIKELY { return "[]"; }
+// Hints are static; for measured layouts build with PGO instead
+// (MSVC /GL + /LTCG:PGOPTIMIZE, GCC/Clang -fprofile-use).
+
+#if defined(__GNUC__) || defined(__clang__)
+#define BRIDGE_HOT __attribute__((hot))
+#define BRIDGE_COLD __attribute__((cold, noinline))
+#else
+#define BRIDGE_HOT
+#define BRIDGE_COLD
+#endif
+
+#if defined(__has_cpp_attribute)
+#if __has_cpp_attribute(likely) && __cplusplus >= 202002L
+#define BRIDGE_LIKELY [[likely]]
+#define BRIDGE_UNLIKELY [[unlikely]]
+#endif
+#endif
+#ifndef BRIDGE_LIKELY
+#define BRIDGE_LIKELY
+#define BRIDGE_UNLIKELY
+#endif
+
 // =============================================================================
 // BASIC TYPES
 // =============================================================================
@@ -143,10 +170,13 @@ static thread_local std::string _bridge_str;
 extern std::string _bridge_error;
 extern bool _bridge_has_error;
 
+// Out-of-line and cold: the compiler treats every BRIDGE_THROW branch as
+// unlikely and keeps it off the hot path of BRIDGE_SAFE functions.
+BRIDGE_COLD void _bridge_set_error(const std::string &msg);
+
 #define BRIDGE_THROW(msg)                                                      \
   do {                                                                         \
-    _bridge_error = msg;                                                       \
-    _bridge_has_error = true;                                                  \
+    _bridge_set_error(msg);                                                    \
     return {};                                                                 \
   } while (0)
 
@@ -158,17 +188,28 @@ extern bool _bridge_has_error;
 
 extern std::vector<std::string> _bridge_callback_queue;
 
+// Shared serializers: one instantiation per value type instead of a copy of
+// the formatting code in every call_<name>() the macros below generate.
+template <typename T>
+inline void _bridge_push_callback(const char *name, const T &value) {
+  std::ostringstream ss;
+  ss << "{\"callback\":\"" << name << "\",\"value\":" << value << "}";
+  _bridge_callback_queue.push_back(ss.str());
+}
+
+inline void _bridge_push_callback_str(const char *name, str value) {
+  std::ostringstream ss;
+  ss << "{\"callback\":\"" << name << "\",\"value\":\"" << (value ? value : "")
+     << "\"}";
+  _bridge_callback_queue.push_back(ss.str());
+}
+
 #define BRIDGE_CALLBACK(name, paramType)                                       \
   inline void call_##name(paramType value) {                                   \
-    std::ostringstream ss;                                                     \
-    ss << "{\"callback\":\"" #name "\",\"value\":" << value << "}";            \
-    _bridge_callback_queue.push_back(ss.str());                                \
+    _bridge_push_callback(#name, value);                                       \
   }
 
 #define BRIDGE_CALLBACK_STR(name)                                              \
   inline void call_##name(str value) {                                         \
-    std::ostringstream ss;                                                     \
-    ss << "{\"callback\":\"" #name "\",\"value\":\"" << (value ? value : "")   \
-       << "\"}";                                                               \
-    _bridge_callback_queue.push_back(ss.str());                                \
+    _bridge_push_callback_str(#name, value);                                   \
   }
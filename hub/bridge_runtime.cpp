@@ -8,6 +8,11 @@
 std::string _bridge_error;
 bool _bridge_has_error = false;
 
+void _bridge_set_error(const std::string &msg) {
+  _bridge_error = msg;
+  _bridge_has_error = true;
+}
+
 // Global callback queue
 std::vector<std::string> _bridge_callback_queue;
 
@@ -41,16 +46,25 @@ BRIDGE str bridge_get_last_error() {
 BRIDGE int bridge_has_error() { return _bridge_has_error ? 1 : 0; }
 
 BRIDGE str bridge_poll_callbacks() {
-  if (_bridge_callback_queue.empty())
+  // Polled on a timer; the queue is usually empty
+  if (_bridge_callback_queue.empty()) BRIDGE_LIKELY {
     return "[]";
-  std::ostringstream ss;
-  ss << "[";
+  }
+
+  // Size the result once: brackets + entries + separating commas
+  size_t total = 2 + (_bridge_callback_queue.size() - 1);
+  for (const auto &entry : _bridge_callback_queue)
+    total += entry.size();
+
+  _bridge_str.clear();
+  _bridge_str.reserve(total);
+  _bridge_str += '[';
   for (size_t i = 0; i < _bridge_callback_queue.size(); i++) {
     if (i > 0)
-      ss << ",";
-    ss << _bridge_callback_queue[i];
+      _bridge_str += ',';
+    _bridge_str += _bridge_callback_queue[i];
   }
-  ss << "]";
+  _bridge_str += ']';
   _bridge_callback_queue.clear();
-  return RET(ss.str());
+  return _bridge_str.c_str();
 }
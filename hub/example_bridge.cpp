@@ -66,28 +66,33 @@ BRIDGE int DemoCalc_new() {
   return id;
 }
 
+// Handle -> instance resolution is a single hash lookup per call
+static DemoCalc *demo_calc_find(int handle) {
+  auto it = _demo_calcs.find(handle);
+  return it != _demo_calcs.end() ? it->second : nullptr;
+}
+
 BRIDGE void DemoCalc_delete(int handle) {
-  if (_demo_calcs.count(handle)) {
-    delete _demo_calcs[handle];
-    _demo_calcs.erase(handle);
+  auto it = _demo_calcs.find(handle);
+  if (it != _demo_calcs.end()) {
+    delete it->second;
+    _demo_calcs.erase(it);
   }
 }
 
 BRIDGE int DemoCalc_getValue(int handle) {
-  if (!_demo_calcs.count(handle))
-    return 0;
-  return _demo_calcs[handle]->getValue();
+  DemoCalc *calc = demo_calc_find(handle);
+  return calc ? calc->getValue() : 0;
 }
 
 BRIDGE int DemoCalc_addTo(int handle, int n) {
-  if (!_demo_calcs.count(handle))
-    return 0;
-  return _demo_calcs[handle]->addTo(n);
+  DemoCalc *calc = demo_calc_find(handle);
+  return calc ? calc->addTo(n) : 0;
 }
 
 BRIDGE void DemoCalc_reset(int handle) {
-  if (_demo_calcs.count(handle))
-    _demo_calcs[handle]->reset();
+  if (DemoCalc *calc = demo_calc_find(handle))
+    calc->reset();
 }
 
 // =============================================================================
@@ -165,7 +170,6 @@ BRIDGE int DemoCircle_new(double radius) {
 }
 
 BRIDGE double DemoCircle_area(int handle) {
-  if (!_demo_circles.count(handle))
-    return 0;
-  return _demo_circles[handle]->area();
+  auto it = _demo_circles.find(handle);
+  return it != _demo_circles.end() ? it->second->area() : 0;
 }
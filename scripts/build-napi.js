@@ -115,20 +115,30 @@ function generateNapiWrapper(targetFile) {
         });
     }
 
+    // Fill all three sections in a single pass over the functions
+    const declarations = [];
+    const wrappers = [];
+    const registrations = [];
+    for (const f of functions) {
+        declarations.push(`extern "C" ${f.returnType} ${f.name}(${f.params});`);
+        wrappers.push(generateWrapperFunction(f));
+        registrations.push(`    exports.Set("${f.name}", Napi::Function::New(env, _napi_${f.name}));`);
+    }
+
     const wrapper = `
 // Auto-generated N-API wrapper
 #include <napi.h>
 #include "bridge_core.h"
 
 // Forward declarations from user code
-${functions.map(f => `extern "C" ${f.returnType} ${f.name}(${f.params});`).join('\n')}
+${declarations.join('\n')}
 
 // N-API wrappers
-${functions.map(f => generateWrapperFunction(f)).join('\n\n')}
+${wrappers.join('\n\n')}
 
 // Init
 Napi::Object Init(Napi::Env env, Napi::Object exports) {
-${functions.map(f => `    exports.Set("${f.name}", Napi::Function::New(env, _napi_${f.name}));`).join('\n')}
+${registrations.join('\n')}
     return exports;
 }
 
@@ -140,12 +150,42 @@ NODE_API_MODULE(cppbridge, Init)
     return functions;
 }
 
-function generateWrapperFunction(fn) {
-    const isString = fn.returnType.includes('char*');
-    const isVoid = fn.returnType === 'void';
-    const isInt = fn.returnType === 'int';
-    const isDouble = fn.returnType === 'double' || fn.returnType === 'float';
+// Type kinds: scalar types resolve with one table lookup, anything else is a
+// string if it is a char pointer and an opaque value otherwise.
+const TYPE_KINDS = {
+    'void': 'void',
+    'int': 'int',
+    'double': 'double',
+    'float': 'double',
+};
+
+function classifyType(type) {
+    return TYPE_KINDS[type] || (type.includes('char*') ? 'string' : 'other');
+}
+
+const ARG_TEMPLATES = {
+    string: (p) => `    std::string _${p.name} = info[${p.index}].As<Napi::String>().Utf8Value();
+    const char* ${p.name} = _${p.name}.c_str();`,
+    int: (p) => `    int ${p.name} = info[${p.index}].As<Napi::Number>().Int32Value();`,
+    double: (p) => `    double ${p.name} = info[${p.index}].As<Napi::Number>().DoubleValue();`,
+    other: (p) => `    auto ${p.name} = info[${p.index}];`,
+};
+ARG_TEMPLATES.void = ARG_TEMPLATES.other;
+
+const RETURN_TEMPLATES = {
+    void: (call) => `    ${call};
+    return env.Undefined();`,
+    string: (call) => `    const char* result = ${call};
+    return Napi::String::New(env, result ? result : "");`,
+    int: (call) => `    int result = ${call};
+    return Napi::Number::New(env, result);`,
+    double: (call) => `    double result = ${call};
+    return Napi::Number::New(env, result);`,
+    other: (call) => `    auto result = ${call};
+    return Napi::Number::New(env, result);`,
+};
 
+function generateWrapperFunction(fn) {
     const params = fn.params.split(',').filter(p => p.trim()).map((p, i) => {
         const parts = p.trim().split(/\s+/);
         const type = parts.slice(0, -1).join(' ');
@@ -153,37 +193,12 @@ function generateWrapperFunction(fn) {
         return { type, name, index: i };
     });
 
-    const argConversions = params.map(p => {
-        if (p.type.includes('char*')) {
-            return `    std::string _${p.name} = info[${p.index}].As<Napi::String>().Utf8Value();
-    const char* ${p.name} = _${p.name}.c_str();`;
-        } else if (p.type === 'int') {
-            return `    int ${p.name} = info[${p.index}].As<Napi::Number>().Int32Value();`;
-        } else if (p.type === 'double' || p.type === 'float') {
-            return `    double ${p.name} = info[${p.index}].As<Napi::Number>().DoubleValue();`;
-        }
-        return `    auto ${p.name} = info[${p.index}];`;
-    }).join('\n');
+    const argConversions = params
+        .map(p => ARG_TEMPLATES[classifyType(p.type)](p))
+        .join('\n');
 
     const callArgs = params.map(p => p.name).join(', ');
-
-    let returnStatement;
-    if (isVoid) {
-        returnStatement = `    ${fn.name}(${callArgs});
-    return env.Undefined();`;
-    } else if (isString) {
-        returnStatement = `    const char* result = ${fn.name}(${callArgs});
-    return Napi::String::New(env, result ? result : "");`;
-    } else if (isInt) {
-        returnStatement = `    int result = ${fn.name}(${callArgs});
-    return Napi::Number::New(env, result);`;
-    } else if (isDouble) {
-        returnStatement = `    double result = ${fn.name}(${callArgs});
-    return Napi::Number::New(env, result);`;
-    } else {
-        returnStatement = `    auto result = ${fn.name}(${callArgs});
-    return Napi::Number::New(env, result);`;
-    }
+    const returnStatement = RETURN_TEMPLATES[classifyType(fn.returnType)](`${fn.name}(${callArgs})`);
 
     return `Napi::Value _napi_${fn.name}(const Napi::CallbackInfo& info) {
     Napi::Env env = info.Env();
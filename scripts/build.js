@@ -177,6 +177,13 @@ function findSourceFiles(options) {
 // C++ PARSER
 // =============================================================================
 
+// BRIDGE_FN, BRIDGE_ASYNC, BRIDGE_JSON - compiled once, tagged with their kind
+const BRIDGE_PATTERNS = [
+    { kind: 'fn', regex: /BRIDGE_FN\s*\(\s*([a-zA-Z_*\s]+?)\s*,\s*(\w+)\s*(?:,\s*(.+?))?\s*\)/ },
+    { kind: 'async', regex: /BRIDGE_ASYNC\s*\(\s*([a-zA-Z_*\s]+?)\s*,\s*(\w+)\s*(?:,\s*(.+?))?\s*\)/ },
+    { kind: 'json', regex: /BRIDGE_JSON\s*\(\s*(\w+)\s*(?:,\s*(.+?))?\s*\)/ },
+];
+
 function parseBridgeFunctions(cppFiles) {
     console.log('🔎 Scanning for BRIDGE functions...');
 
@@ -187,21 +194,18 @@ function parseBridgeFunctions(cppFiles) {
         const lines = content.split('\n');
 
         for (const line of lines) {
+            // Every pattern needs the marker; most lines are rejected here
+            if (!line.includes('BRIDGE_')) continue;
+
             const trimmed = line.trim();
             if (trimmed.startsWith('//') || trimmed.startsWith('/*')) continue;
 
-            // Match BRIDGE_FN, BRIDGE_ASYNC, BRIDGE_JSON
-            const patterns = [
-                /BRIDGE_FN\s*\(\s*([a-zA-Z_*\s]+?)\s*,\s*(\w+)\s*(?:,\s*(.+?))?\s*\)/,
-                /BRIDGE_ASYNC\s*\(\s*([a-zA-Z_*\s]+?)\s*,\s*(\w+)\s*(?:,\s*(.+?))?\s*\)/,
-                /BRIDGE_JSON\s*\(\s*(\w+)\s*(?:,\s*(.+?))?\s*\)/,
-            ];
-
-            for (const regex of patterns) {
+            for (const { kind, regex } of BRIDGE_PATTERNS) {
                 const match = line.match(regex);
                 if (match) {
-                    const isAsync = line.includes('BRIDGE_ASYNC');
-                    const isJson = line.includes('BRIDGE_JSON');
+                    // The matched pattern already tells us the kind
+                    const isAsync = kind === 'async';
+                    const isJson = kind === 'json';
 
                     let returnType, funcName, argsString;
                     if (isJson) {
@@ -251,14 +255,21 @@ function parseArgs2(argsString) {
     return params;
 }
 
+// Type tables are built once at load time, not on every lookup
+const NORMALIZE_TYPE_MAP = {
+    'int': 'int', 'float': 'float', 'double': 'double',
+    'bool': 'bool', 'void': 'void',
+    'char*': 'str', 'const char*': 'str', 'const char *': 'str',
+};
+
+const TS_TYPE_MAP = {
+    'int': 'number', 'float': 'number', 'double': 'number',
+    'bool': 'boolean', 'str': 'string', 'void': 'void',
+};
+
 function normalizeType(cppType) {
-    const map = {
-        'int': 'int', 'float': 'float', 'double': 'double',
-        'bool': 'bool', 'void': 'void',
-        'char*': 'str', 'const char*': 'str', 'const char *': 'str',
-    };
     const normalized = cppType.replace(/\s+/g, ' ').trim();
-    if (map[normalized]) return map[normalized];
+    if (NORMALIZE_TYPE_MAP[normalized]) return NORMALIZE_TYPE_MAP[normalized];
     if (normalized.includes('char')) return 'str';
     return normalized;
 }
@@ -293,23 +304,24 @@ function generateOutputs(functions, dllName) {
     console.log('📝 Generated: registry.json');
 
     // TypeScript definitions
-    const tsMap = { 'int': 'number', 'float': 'number', 'double': 'number', 'bool': 'boolean', 'str': 'string', 'void': 'void' };
-    const toTs = (t) => tsMap[t] || 'any';
+    const toTs = (t) => TS_TYPE_MAP[t] || 'any';
 
-    let dts = `// Auto-generated by CPPBridge v3.2\n\n`;
-    dts += `declare const bridge: {\n`;
+    const dts = [
+        `// Auto-generated by CPPBridge v3.2\n\n`,
+        `declare const bridge: {\n`,
+    ];
 
     for (const fn of functions) {
         const ret = fn.async ? `Promise<${toTs(fn.returnType)}>` : toTs(fn.returnType);
         const args = fn.params.map(p => `${p.name}: ${toTs(p.type)}`).join(', ');
-        dts += `  ${fn.name}(${args}): ${ret};\n`;
+        dts.push(`  ${fn.name}(${args}): ${ret};\n`);
     }
 
-    dts += `\n  reload(): typeof bridge;\n`;
-    dts += `  _version: string;\n`;
-    dts += `};\n\nexport = bridge;\n`;
+    dts.push(`\n  reload(): typeof bridge;\n`);
+    dts.push(`  _version: string;\n`);
+    dts.push(`};\n\nexport = bridge;\n`);
 
-    fs.writeFileSync(CONFIG.typesFile, dts);
+    fs.writeFileSync(CONFIG.typesFile, dts.join(''));
     console.log('📝 Generated: index.d.ts');
 }
 
@@ -15,12 +15,17 @@
  * 
  * Usage:
  *   node scripts/generate-registry.js
+ *   node scripts/generate-registry.js --watch   # stay resident, regenerate on save
+ *
+ *   --watch uses a single recursive watcher on macOS and Windows; elsewhere
+ *   it watches each hub/ directory separately.
  * 
  * =============================================================================
  */
 
 const fs = require('fs');
 const path = require('path');
+const crypto = require('crypto');
 
 // =============================================================================
 // SECURITY CONFIGURATION
@@ -35,6 +40,15 @@ const ALLOWED_EXTENSIONS = ['.cpp', '.h', '.hpp', '.cc', '.cxx'];
 const VALID_NAME_REGEX = /^[a-zA-Z_][a-zA-Z0-9_]*$/;
 const MAX_FILE_SIZE = 10 * 1024 * 1024;
 
+// Scan cache: results keyed by content hash, reused across runs.
+// Bump SCANNER_VERSION whenever the patterns below (or the entry shape) change.
+const CACHE_DIR = path.join(PROJECT_ROOT, '.gen_cache');
+const CACHE_PATH = path.join(CACHE_DIR, 'scan-cache.json');
+const SCANNER_VERSION = '6';
+const WATCH_DEBOUNCE_MS = 300;
+// Files read at once; keeps well under low descriptor limits (macOS: 256)
+const SCAN_CONCURRENCY = 16;
+
 // =============================================================================
 // SECURITY FUNCTIONS
 // =============================================================================
@@ -70,6 +84,10 @@ const TYPE_MAP = {
     'uint64_t': 'uint64',
     'int64_t': 'int64',
     'size_t': 'uint64',
+    'uint8_t*': 'buffer',
+    'const uint8_t*': 'buffer',
+    'unsigned char*': 'buffer',
+    'const unsigned char*': 'buffer',
 };
 
 // TypeScript type mapping
@@ -81,37 +99,95 @@ const TS_TYPE_MAP = {
     'str': 'string',
     'uint64': 'bigint',
     'int64': 'bigint',
+    'buffer': 'Uint8Array',
 };
 
+// Canonical spelling: single spaces, pointer/reference sigils attached
+// ("const char *" and "const char*" are the same type)
+function canonicalType(cppType) {
+    return cppType.trim().replace(/\s+/g, ' ').replace(/\s*([*&])\s*/g, '$1');
+}
+
 function mapType(cppType) {
     if (!cppType) return 'int';
-    cppType = cppType.trim().replace(/\s+/g, ' ');
-    return TYPE_MAP[cppType] || 'int';
+    return TYPE_MAP[canonicalType(cppType)] || 'int';
+}
+
+// False when mapType only fell back to 'int' for a type it does not know
+function isKnownType(cppType) {
+    return !!cppType && canonicalType(cppType) in TYPE_MAP;
 }
 
 function mapToTS(registryType) {
     return TS_TYPE_MAP[registryType] || 'number';
 }
 
+// Returns the text between the '(' at openIndex and its matching ')', or
+// null if the list is unbalanced or runs into a body/statement first.
+function readParamList(content, openIndex) {
+    let depth = 0;
+    for (let i = openIndex; i < content.length; i++) {
+        const c = content[i];
+        if (c === '(') {
+            depth++;
+        } else if (c === ')') {
+            if (--depth === 0) return content.slice(openIndex + 1, i);
+        } else if (c === '{' || c === ';') {
+            return null;
+        }
+    }
+    return null;
+}
+
+// Splits on commas outside nested parentheses
+function splitTopLevel(paramsStr) {
+    const parts = [];
+    let depth = 0;
+    let start = 0;
+    for (let i = 0; i < paramsStr.length; i++) {
+        const c = paramsStr[i];
+        if (c === '(') depth++;
+        else if (c === ')') depth--;
+        else if (c === ',' && depth === 0) {
+            parts.push(paramsStr.slice(start, i));
+            start = i + 1;
+        }
+    }
+    parts.push(paramsStr.slice(start));
+    return parts;
+}
+
+const BUFFER_PARAM_REGEX = /^BRIDGE_BUFFER\s*\(\s*(\w+)\s*,\s*(\w+)\s*\)$/;
+
 function parseParams(paramsStr) {
     if (!paramsStr || paramsStr.trim() === '' || paramsStr.trim() === 'void') {
         return [];
     }
 
     const params = [];
-    const parts = paramsStr.split(',');
 
-    for (const part of parts) {
+    for (const part of splitTopLevel(paramsStr)) {
         const trimmed = part.trim();
         if (!trimmed) continue;
 
+        // BRIDGE_BUFFER(data, size) expands to "uint8_t *data, int size"
+        const buffer = trimmed.match(BUFFER_PARAM_REGEX);
+        if (buffer) {
+            params.push({ type: 'buffer', name: buffer[1], known: true });
+            params.push({ type: 'int', name: buffer[2], known: true });
+            continue;
+        }
+
         const tokens = trimmed.split(/\s+/);
         if (tokens.length >= 2) {
-            const type = tokens.slice(0, -1).join(' ');
-            const name = tokens[tokens.length - 1].replace(/[*&]/g, '');
-            params.push({ type: mapType(type), name });
+            // "char *name" binds the pointer to the type, not the name
+            const last = tokens[tokens.length - 1];
+            const sigils = last.match(/^[*&]*/)[0];
+            const type = tokens.slice(0, -1).join(' ') + sigils;
+            const name = last.slice(sigils.length).replace(/[*&]/g, '');
+            params.push({ type: mapType(type), name, known: isKnownType(type) });
         } else if (tokens.length === 1) {
-            params.push({ type: mapType(tokens[0]), name: `arg${params.length}` });
+            params.push({ type: mapType(tokens[0]), name: `arg${params.length}`, known: isKnownType(tokens[0]) });
         }
     }
 
@@ -122,140 +198,274 @@ function parseParams(paramsStr) {
 // FILE SCANNER
 // =============================================================================
 
-function scanFile(filePath) {
+async function scanFile(filePath) {
     if (!isPathSafe(filePath)) return [];
 
     const ext = path.extname(filePath).toLowerCase();
     if (!ALLOWED_EXTENSIONS.includes(ext)) return [];
 
+    // A file removed since the walk has no functions; any other error
+    // (EMFILE, EACCES, ...) must fail the run rather than drop its entries.
     try {
-        const stat = fs.statSync(filePath);
+        const stat = await fs.promises.stat(filePath);
         if (stat.size > MAX_FILE_SIZE) return [];
     } catch (e) {
-        return [];
+        if (e.code === 'ENOENT') return [];
+        throw e;
     }
 
     let content;
     try {
-        content = fs.readFileSync(filePath, 'utf8');
+        content = await fs.promises.readFile(filePath, 'utf8');
     } catch (e) {
-        return [];
+        if (e.code === 'ENOENT') return [];
+        throw e;
     }
 
-    const functions = [];
-
-    // Match BRIDGE patterns
-    const pattern = /(?:BRIDGE|BRIDGE_EXPORT|BRIDGE_SAFE)\s+(\w+(?:\s*\*)?)\s+(\w+)\s*\(([^)]*)\)/g;
-    let match;
-    while ((match = pattern.exec(content)) !== null) {
-        const returnType = match[1].trim();
-        const funcName = match[2].trim();
-        const paramsStr = match[3];
+    // Every pattern below needs a BRIDGE marker; skip third-party headers
+    // (sqlite3.h, jsi.h, ...) without hashing or running the patterns.
+    if (!content.includes('BRIDGE')) return [];
 
-        if (!isValidFunctionName(funcName)) continue;
-        if (funcName.startsWith('_')) continue;
-
-        const params = parseParams(paramsStr);
-
-        functions.push({
-            name: funcName,
-            returnType: mapType(returnType),
-            params: params,
-            async: false
-        });
+    const hash = hashContent(content);
+    let result = scanCache.entries.get(hash);
+    if (!result) {
+        result = scanContent(content);
+        scanCache.entries.set(hash, result);
+        scanCache.dirty = true;
     }
+    scanCache.used.add(hash);
 
-    // Match BRIDGE_VAR patterns
-    const varPattern = /BRIDGE_VAR\s*\(\s*(\w+)\s*,\s*(\w+)/g;
-    while ((match = varPattern.exec(content)) !== null) {
-        const type = match[1];
-        const name = match[2];
-        if (isValidFunctionName(`get_${name}`)) {
-            functions.push({ name: `get_${name}`, returnType: mapType(type), params: [], async: false });
-            functions.push({ name: `set_${name}`, returnType: 'void', params: [{ type: mapType(type), name: 'value' }], async: false });
-        }
+    // Warnings are cached with the functions so a cache hit repeats them
+    for (const warning of result.warnings) {
+        console.warn(`  ⚠️  ${path.relative(PROJECT_ROOT, filePath)}: ${warning}`);
     }
 
-    // Match BRIDGE_VAR_STR
-    const varStrPattern = /BRIDGE_VAR_STR\s*\(\s*(\w+)/g;
-    while ((match = varStrPattern.exec(content)) !== null) {
-        const name = match[1];
-        if (isValidFunctionName(`get_${name}`)) {
-            functions.push({ name: `get_${name}`, returnType: 'str', params: [], async: false });
-            functions.push({ name: `set_${name}`, returnType: 'void', params: [{ type: 'str', name: 'value' }], async: false });
-        }
-    }
+    return result.functions;
+}
+
+// All BRIDGE forms in one alternation so each file is walked once. Named
+// groups tell the forms apart; only one branch participates per match.
+// A match consumes its text, so the function form stops at the name (its
+// parameter list is read separately by readParamList): macros used inside a
+// parameter list (e.g. BRIDGE_VAR) are still found, as they were with
+// separate passes. Forms cannot otherwise nest, since the macro forms only
+// consume names.
+const SCAN_PATTERN = new RegExp([
+    /(?:BRIDGE|BRIDGE_EXPORT|BRIDGE_SAFE)\s+(?<fnReturn>\w+(?:\s*\*)?)\s+(?<fnName>\w+)(?=\s*\()/.source,
+    /BRIDGE_VAR\s*\(\s*(?<varType>\w+)\s*,\s*(?<varName>\w+)/.source,
+    /BRIDGE_VAR_STR\s*\(\s*(?<varStrName>\w+)/.source,
+    /BRIDGE_ENUM_\d+\s*\(\s*(?<enumName>\w+)\s*,(?<enumValues>[^)]+)\)/.source,
+    /BRIDGE_STRUCT_\d+\s*\(\s*(?<structName>\w+)(?<structFields>[^)]*)/.source,
+].join('|'), 'g');
+
+function scanContent(content) {
+    // Bucketed per form so the registry keeps its established ordering:
+    // functions, variables, string variables, enums, structs.
+    const fns = [], vars = [], varStrs = [], enums = [], structs = [];
+    const warnings = [];
+
+    for (const match of content.matchAll(SCAN_PATTERN)) {
+        const g = match.groups;
+        if (g.fnName !== undefined) {
+            const funcName = g.fnName.trim();
+            if (!isValidFunctionName(funcName)) continue;
+            if (funcName.startsWith('_')) continue;
+
+            const open = content.indexOf('(', match.index + match[0].length);
+            const paramsStr = readParamList(content, open);
+            if (paramsStr === null) {
+                // Never record a signature with the wrong argument count
+                warnings.push(`Skipped ${funcName}: unbalanced parameter list`);
+                continue;
+            }
 
-    // Match BRIDGE_ENUM values
-    const enumPattern = /BRIDGE_ENUM_\d+\s*\(\s*(\w+)\s*,([^)]+)\)/g;
-    while ((match = enumPattern.exec(content)) !== null) {
-        const enumName = match[1];
-        const values = match[2].split(',').map(v => v.trim());
-        for (const value of values) {
-            const name = `${enumName}_${value}`;
+            const params = parseParams(paramsStr);
+            fns.push({
+                name: funcName,
+                returnType: mapType(g.fnReturn.trim()),
+                params,
+                async: false,
+                resolved: isKnownType(g.fnReturn) && params.every(p => p.known)
+            });
+        } else if (g.varName !== undefined) {
+            const name = g.varName;
+            if (isValidFunctionName(`get_${name}`)) {
+                const resolved = isKnownType(g.varType);
+                vars.push({ name: `get_${name}`, returnType: mapType(g.varType), params: [], async: false, resolved });
+                vars.push({ name: `set_${name}`, returnType: 'void', params: [{ type: mapType(g.varType), name: 'value' }], async: false, resolved });
+            }
+        } else if (g.varStrName !== undefined) {
+            const name = g.varStrName;
+            if (isValidFunctionName(`get_${name}`)) {
+                varStrs.push({ name: `get_${name}`, returnType: 'str', params: [], async: false, resolved: true });
+                varStrs.push({ name: `set_${name}`, returnType: 'void', params: [{ type: 'str', name: 'value' }], async: false, resolved: true });
+            }
+        } else if (g.enumName !== undefined) {
+            for (const value of g.enumValues.split(',').map(v => v.trim())) {
+                const name = `${g.enumName}_${value}`;
+                if (isValidFunctionName(name)) {
+                    enums.push({ name, returnType: 'int', params: [], async: false, resolved: true });
+                }
+            }
+        } else {
+            // BRIDGE_STRUCT_N(Name, t1, n1, t2, n2, ...): Name_create takes
+            // one argument per field, in declaration order
+            const name = `${g.structName}_create`;
             if (isValidFunctionName(name)) {
-                functions.push({ name, returnType: 'int', params: [], async: false });
+                const fields = g.structFields.split(',').map(f => f.trim()).slice(1);
+                const params = [];
+                for (let i = 0; i + 1 < fields.length; i += 2) {
+                    params.push({ type: mapType(fields[i]), name: fields[i + 1], known: isKnownType(fields[i]) });
+                }
+                structs.push({ name, returnType: 'str', params, async: false, resolved: params.every(p => p.known) });
             }
         }
     }
 
-    // Match BRIDGE_STRUCT
-    const structPattern = /BRIDGE_STRUCT_(\d+)\s*\(\s*(\w+)/g;
-    while ((match = structPattern.exec(content)) !== null) {
-        const structName = match[2];
-        const name = `${structName}_create`;
-        if (isValidFunctionName(name)) {
-            functions.push({ name, returnType: 'str', params: [], async: false });
+    return { functions: fns.concat(vars, varStrs, enums, structs), warnings };
+}
+
+// =============================================================================
+// SCAN CACHE
+// =============================================================================
+
+const scanCache = { entries: new Map(), used: new Set(), dirty: false };
+
+function hashContent(content) {
+    return crypto.createHash('sha256')
+        .update(content)
+        .update(`|${SCANNER_VERSION}`)
+        .digest('hex');
+}
+
+function loadScanCache() {
+    try {
+        const data = JSON.parse(fs.readFileSync(CACHE_PATH, 'utf8'));
+        if (data.version === SCANNER_VERSION && data.entries) {
+            scanCache.entries = new Map(Object.entries(data.entries));
+        }
+    } catch (e) { }
+}
+
+function saveScanCache() {
+    // Drop entries for content that no longer exists in the tree
+    let pruned = false;
+    for (const hash of scanCache.entries.keys()) {
+        if (!scanCache.used.has(hash)) {
+            scanCache.entries.delete(hash);
+            pruned = true;
         }
     }
+    if (!scanCache.dirty && !pruned) return;
 
-    return functions;
+    try {
+        fs.mkdirSync(CACHE_DIR, { recursive: true });
+        fs.writeFileSync(CACHE_PATH, JSON.stringify({
+            version: SCANNER_VERSION,
+            entries: Object.fromEntries(scanCache.entries)
+        }));
+    } catch (e) { }
 }
 
-function scanDirectory(dir) {
+function isIgnoredEntry(name) {
+    return name.startsWith('.') || name === 'node_modules' || name === 'build';
+}
+
+async function scanDirectory(dir) {
     if (!isPathSafe(dir)) return [];
 
-    const allFunctions = [];
+    const sourceFiles = [];
+
+    // Iterative depth-first walk; entries are pushed in reverse so they pop in
+    // readdir order, matching the previous recursive traversal.
+    const stack = [{ filePath: dir, isDir: true }];
 
-    function walk(currentDir) {
-        if (!isPathSafe(currentDir)) return;
+    while (stack.length > 0) {
+        const { filePath, isDir } = stack.pop();
 
-        let files;
+        if (!isDir) {
+            sourceFiles.push(filePath);
+            continue;
+        }
+
+        let entries;
         try {
-            files = fs.readdirSync(currentDir);
+            entries = fs.readdirSync(filePath, { withFileTypes: true });
         } catch (e) {
-            return;
+            continue;
         }
 
-        for (const file of files) {
-            if (file.startsWith('.') || file === 'node_modules' || file === 'build') {
-                continue;
+        for (let i = entries.length - 1; i >= 0; i--) {
+            const entry = entries[i];
+            const name = entry.name;
+            if (isIgnoredEntry(name)) continue;
+
+            const childPath = path.join(filePath, name);
+            if (!isPathSafe(childPath)) continue;
+
+            // Dirent already carries the type; only symlinks need a stat
+            let childIsDir = entry.isDirectory();
+            let childIsFile = entry.isFile();
+            if (entry.isSymbolicLink()) {
+                try {
+                    const stat = fs.statSync(childPath);
+                    childIsDir = stat.isDirectory();
+                    childIsFile = stat.isFile();
+                } catch (e) {
+                    continue;
+                }
             }
 
-            const filePath = path.join(currentDir, file);
-            if (!isPathSafe(filePath)) continue;
-
-            let stat;
-            try {
-                stat = fs.statSync(filePath);
-            } catch (e) {
-                continue;
+            if (childIsDir) {
+                stack.push({ filePath: childPath, isDir: true });
+            } else if (childIsFile &&
+                ALLOWED_EXTENSIONS.includes(path.extname(name).toLowerCase())) {
+                stack.push({ filePath: childPath, isDir: false });
             }
+        }
+    }
 
-            if (stat.isDirectory()) {
-                walk(filePath);
-            } else if (stat.isFile()) {
-                const ext = path.extname(file).toLowerCase();
-                if (ALLOWED_EXTENSIONS.includes(ext)) {
-                    const functions = scanFile(filePath);
-                    allFunctions.push(...functions);
-                }
-            }
+    // Files are independent: read and scan up to SCAN_CONCURRENCY of them
+    // at a time, then flatten in walk order so the registry stays
+    // deterministic.
+    const results = new Array(sourceFiles.length);
+    let next = 0;
+    async function worker() {
+        while (next < sourceFiles.length) {
+            const i = next++;
+            results[i] = await scanFile(sourceFiles[i]);
         }
     }
+    const workers = [];
+    for (let i = 0; i < Math.min(SCAN_CONCURRENCY, sourceFiles.length); i++) {
+        workers.push(worker());
+    }
+    await Promise.all(workers);
+    return results.flat();
+}
+
+// =============================================================================
+// OUTPUT WRITER
+// =============================================================================
 
-    walk(dir);
-    return allFunctions;
+// Leaves the file (and its mtime) untouched when the content is identical, so
+// downstream watchers and build caches are not invalidated by no-op runs.
+// New content goes to a temp file first and is renamed into place, so an
+// interrupted run never leaves a half-written output behind.
+function writeFileIfChanged(filePath, content) {
+    try {
+        if (fs.readFileSync(filePath, 'utf8') === content) return false;
+    } catch (e) { }
+
+    const tmpPath = `${filePath}.${process.pid}.tmp`;
+    try {
+        fs.writeFileSync(tmpPath, content);
+        fs.renameSync(tmpPath, filePath);
+    } catch (e) {
+        try { fs.unlinkSync(tmpPath); } catch (e2) { }
+        throw e;
+    }
+    return true;
 }
 
 // =============================================================================
@@ -263,7 +473,8 @@ function scanDirectory(dir) {
 // =============================================================================
 
 function generateTypeScript(functions) {
-    let ts = `/**
+    // Collect fragments and join once instead of growing a string with +=
+    const parts = [`/**
  * UniversalBridge TypeScript Definitions
  * Auto-generated by generate-registry.js
  * 
@@ -299,7 +510,7 @@ export interface UniversalBridge {
     // =========================================================================
     // Generated C++ Functions
     // =========================================================================
-`;
+`];
 
     for (const fn of functions) {
         const tsReturn = mapToTS(fn.returnType);
@@ -309,36 +520,46 @@ export interface UniversalBridge {
             return `${paramName}: ${paramType}`;
         }).join(', ');
 
-        ts += `    ${fn.name}(${tsParams}): ${tsReturn};\n`;
+        parts.push(`    ${fn.name}(${tsParams}): ${tsReturn};\n`);
     }
 
-    ts += `}
+    parts.push(`}
 
 declare const bridge: UniversalBridge;
 export default bridge;
-`;
+`);
 
-    return ts;
+    return parts.join('');
 }
 
 // =============================================================================
 // MAIN
 // =============================================================================
 
-function main() {
-    console.log('╔══════════════════════════════════════════════════════════╗');
-    console.log('║  Secure Registry & TypeScript Generator v6.0             ║');
-    console.log('╚══════════════════════════════════════════════════════════╝\n');
-
-    console.log('🔒 Security: All protections enabled\n');
-    console.log(`📂 Scanning: ${HUB_DIR}\n`);
-
-    if (!isPathSafe(HUB_DIR)) {
-        console.error('❌ Security: Invalid scan directory');
-        process.exit(1);
+// Names produced by the previous scan in this process (watch mode)
+let lastScannedNames = null;
+// Entries removed while watching, and the registry key order including
+// them, so a function that comes back gets its old entry and place again
+const removedEntries = new Map();
+let registryOrder = [];
+
+// Adds keys missing from order right after their predecessor in keys
+function mergeOrder(order, keys) {
+    const merged = order.slice();
+    const known = new Set(merged);
+    for (let i = 0; i < keys.length; i++) {
+        if (known.has(keys[i])) continue;
+        const at = i === 0 ? 0 : merged.indexOf(keys[i - 1]) + 1;
+        merged.splice(at, 0, keys[i]);
+        known.add(keys[i]);
     }
+    return merged;
+}
 
-    const functions = scanDirectory(HUB_DIR);
+async function generate() {
+    scanCache.used = new Set();
+    const functions = await scanDirectory(HUB_DIR);
+    saveScanCache();
 
     // Remove duplicates
     const seen = new Set();
@@ -359,22 +580,73 @@ function main() {
     // Update version
     registry.version = '6.0.0';
 
-    // Merge new functions
     let added = 0;
+    let updated = 0;
+
+    // Functions removed earlier in this watch session come back as their
+    // old entry (hand-set flags included) at their old position, exactly as
+    // a one-shot run that never removed them would leave the registry.
+    const restored = new Set(unique
+        .map(fn => fn.name)
+        .filter(name => !registry.functions[name] && removedEntries.has(name)));
+    if (restored.size > 0) {
+        const current = registry.functions;
+        const functions = {};
+        for (const name of mergeOrder(registryOrder, Object.keys(current))) {
+            if (current[name]) {
+                functions[name] = current[name];
+            } else if (restored.has(name)) {
+                functions[name] = removedEntries.get(name);
+                removedEntries.delete(name);
+                added++;
+                console.log(`  + ${name}`);
+            }
+        }
+        registry.functions = functions;
+    }
+
+    // Merge scanned functions: add new names and refresh the signature of
+    // existing ones (hand-set flags such as async are kept). A signature
+    // containing a type outside TYPE_MAP would only come back as a guessed
+    // 'int', so such entries keep their hand-maintained signature. Entries
+    // the scanner cannot see (e.g. __declspec exports) are left untouched.
     for (const fn of unique) {
-        if (!registry.functions[fn.name]) {
-            registry.functions[fn.name] = {
-                returnType: fn.returnType,
-                params: fn.params.map(p => p.type),
-                async: fn.async
-            };
+        const returnType = fn.returnType;
+        const params = fn.params.map(p => p.type);
+        const existing = registry.functions[fn.name];
+        if (!existing) {
+            registry.functions[fn.name] = { returnType, params, async: fn.async };
             added++;
             console.log(`  + ${fn.name}`);
+        } else if (fn.resolved && (existing.returnType !== returnType ||
+            JSON.stringify(existing.params) !== JSON.stringify(params))) {
+            existing.returnType = returnType;
+            existing.params = params;
+            updated++;
+            console.log(`  ~ ${fn.name}`);
         }
     }
 
+    // Drop functions that the previous scan in this process produced but this
+    // one no longer does (deleted or renamed while watching). A one-shot run
+    // has no previous scan, so it never removes hand-maintained entries.
+    let removed = 0;
+    const scannedNames = new Set(unique.map(fn => fn.name));
+    registryOrder = mergeOrder(registryOrder, Object.keys(registry.functions));
+    if (lastScannedNames) {
+        for (const name of lastScannedNames) {
+            if (!scannedNames.has(name) && registry.functions[name]) {
+                removedEntries.set(name, registry.functions[name]);
+                delete registry.functions[name];
+                removed++;
+                console.log(`  - ${name}`);
+            }
+        }
+    }
+    lastScannedNames = scannedNames;
+
     // Save registry
-    fs.writeFileSync(REGISTRY_PATH, JSON.stringify(registry, null, 2));
+    const registryChanged = writeFileIfChanged(REGISTRY_PATH, JSON.stringify(registry, null, 2));
 
     // Generate TypeScript
     const allFns = Object.entries(registry.functions).map(([name, info]) => ({
@@ -385,11 +657,149 @@ function main() {
     }));
 
     const tsContent = generateTypeScript(allFns);
-    fs.writeFileSync(TYPES_PATH, tsContent);
-
-    console.log(`\n✅ Registry updated: ${Object.keys(registry.functions).length} functions`);
-    console.log(`✅ TypeScript types: bridge.d.ts generated`);
+    const typesChanged = writeFileIfChanged(TYPES_PATH, tsContent);
+
+    const fnCount = Object.keys(registry.functions).length;
+    console.log(registryChanged
+        ? `\n✅ Registry updated: ${fnCount} functions`
+        : `\n✅ Registry up-to-date: ${fnCount} functions`);
+    console.log(typesChanged
+        ? `✅ TypeScript types: bridge.d.ts generated`
+        : `✅ TypeScript types: bridge.d.ts up-to-date`);
     console.log(`   New functions added: ${added}`);
+    console.log(`   Signatures updated: ${updated}`);
+    if (removed) console.log(`   Functions removed: ${removed}`);
+}
+
+// =============================================================================
+// WATCH MODE
+// =============================================================================
+// Keeps one process (and its in-memory scan cache) alive instead of spawning
+// a fresh generator per edit; unchanged files are never re-scanned.
+
+function watchHub() {
+    let debounceTimer = null;
+    let running = false;
+    let pending = false;
+
+    async function regenerate() {
+        if (running) {
+            pending = true;
+            return;
+        }
+        running = true;
+        try {
+            console.log(`\n🔄 [${new Date().toLocaleTimeString()}] Regenerating...`);
+            await generate();
+        } catch (e) {
+            console.error(`❌ ${e.message}`);
+        }
+        running = false;
+        if (pending) {
+            pending = false;
+            regenerate();
+        }
+    }
+
+    function onChange(eventType, filename) {
+        if (!filename) return;
+        const ext = path.extname(filename).toLowerCase();
+        if (!ALLOWED_EXTENSIONS.includes(ext)) {
+            // Only a rename can be a subdirectory coming or going (and with it
+            // the files inside); the per-directory watchers must follow it.
+            if (eventType !== 'rename') return;
+            if (!recursive) syncDirWatchers();
+        }
+
+        if (debounceTimer) clearTimeout(debounceTimer);
+        debounceTimer = setTimeout(regenerate, WATCH_DEBOUNCE_MS);
+    }
+
+    // Recursive fs.watch is native only on macOS and Windows. Linux has it
+    // from Node 20, but it stops reporting a file once an editor replaces it
+    // via rename, so use one non-recursive watcher per hub/ directory there.
+    const recursive = process.platform === 'darwin' || process.platform === 'win32';
+    const dirWatchers = new Map();
+
+    function listHubDirs() {
+        const dirs = [];
+        const stack = [HUB_DIR];
+        while (stack.length > 0) {
+            const dir = stack.pop();
+            dirs.push(dir);
+            let entries;
+            try {
+                entries = fs.readdirSync(dir, { withFileTypes: true });
+            } catch (e) {
+                continue;
+            }
+            for (const entry of entries) {
+                if (!entry.isDirectory() || isIgnoredEntry(entry.name)) continue;
+                const childPath = path.join(dir, entry.name);
+                if (isPathSafe(childPath)) stack.push(childPath);
+            }
+        }
+        return dirs;
+    }
+
+    function syncDirWatchers() {
+        const dirs = new Set(listHubDirs());
+        for (const [dir, watcher] of dirWatchers) {
+            if (!dirs.has(dir)) {
+                watcher.close();
+                dirWatchers.delete(dir);
+            }
+        }
+        for (const dir of dirs) {
+            if (dirWatchers.has(dir)) continue;
+            try {
+                const watcher = fs.watch(dir, { persistent: true }, onChange);
+                watcher.on('error', () => {
+                    watcher.close();
+                    dirWatchers.delete(dir);
+                });
+                dirWatchers.set(dir, watcher);
+            } catch (e) { }
+        }
+    }
+
+    try {
+        if (recursive) {
+            fs.watch(HUB_DIR, { persistent: true, recursive: true }, onChange);
+        } else {
+            syncDirWatchers();
+            if (dirWatchers.size === 0) throw new Error(`cannot watch ${HUB_DIR}`);
+        }
+    } catch (e) {
+        console.error(`❌ Watch mode unavailable: ${e.message}`);
+        process.exit(1);
+    }
+
+    console.log('\n📡 Watching hub/ for changes. Press Ctrl+C to stop.');
+}
+
+async function main() {
+    console.log('╔══════════════════════════════════════════════════════════╗');
+    console.log('║  Secure Registry & TypeScript Generator v6.0             ║');
+    console.log('╚══════════════════════════════════════════════════════════╝\n');
+
+    console.log('🔒 Security: All protections enabled\n');
+    console.log(`📂 Scanning: ${HUB_DIR}\n`);
+
+    if (!isPathSafe(HUB_DIR)) {
+        console.error('❌ Security: Invalid scan directory');
+        process.exit(1);
+    }
+
+    loadScanCache();
+    await generate();
+
+    if (process.argv.includes('--watch')) {
+        watchHub();
+    }
 }
 
-main();
+main().catch(e => {
+    console.error(`❌ ${e.message}`);
+    process.exit(1);
+});